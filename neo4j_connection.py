@@ -1,48 +1,344 @@
+import asyncio
 import logging
-from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
-from neo4j import GraphDatabase
-from open_library_API import fetch_books_by_subject, extract_book_data, clean_data
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from neo4j import WRITE_ACCESS, AsyncGraphDatabase, GraphDatabase
+from neo4j.exceptions import ClientError
 import pandas as pd
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
-class Neo4jConnector:
-    """Class to handle Neo4j database operations"""
+CONSTRAINT_QUERIES = (
+    """
+    CREATE CONSTRAINT book_id_constraint IF NOT EXISTS
+    FOR (b:Book) REQUIRE b.id IS UNIQUE
+    """,
+    """
+    CREATE CONSTRAINT author_name_constraint IF NOT EXISTS
+    FOR (a:Author) REQUIRE a.name IS UNIQUE
+    """,
+    """
+    CREATE CONSTRAINT subject_name_constraint IF NOT EXISTS
+    FOR (s:Subject) REQUIRE s.name IS UNIQUE
+    """,
+    """
+    CREATE CONSTRAINT year_value_constraint IF NOT EXISTS
+    FOR (y:Year) REQUIRE y.value IS UNIQUE
+    """,
+)
+
+# Batch sizes for the parallel Book MERGE stage, timed under the load's concurrency when no batch_size
+# is given, capped to keep transactions short
+BATCH_SIZE_CANDIDATES = (100, 500, 2000)
+MAX_BATCH_SIZE = 2000
+# The serial link pass has no concurrent writers to block, so it uses the largest batches
+LINK_BATCH_SIZE = MAX_BATCH_SIZE
+
+APOC_MIN_ROWS = 10000
+APOC_BATCH_SIZE = 1000
+
+# Authors, subjects and years are deduplicated client-side and MERGEd once up front
+CYPHER_MERGE_AUTHORS = "UNWIND $authors AS name MERGE (:Author {name: name})"
+CYPHER_MERGE_SUBJECTS = "UNWIND $subjects AS name MERGE (:Subject {name: name})"
+CYPHER_MERGE_YEARS = "UNWIND $years AS value MERGE (:Year {value: value})"
+
+# Per-row Book MERGE; it touches only the row's own Book node, so shards of distinct ids can run in parallel
+CYPHER_MERGE_BOOK_ROW = """
+    MERGE (b:Book {id: r.id})
+    SET b.title = r.title,
+        b.edition_count = r.edition_count,
+        b.confidence_score = r.confidence_score,
+        b.date_ingested = r.date_ingested
+"""
+
+# Per-row linking to the pre-created Subject, Year and Author nodes; these are shared
+# between books, so links are written in one serial pass to avoid lock contention
+CYPHER_LINK_BOOK_ROW = """
+    MATCH (b:Book {id: r.id})
+    MATCH (s:Subject {name: r.subject})
+    MERGE (b)-[:HAS_SUBJECT]->(s)
+    WITH b, r
+    OPTIONAL MATCH (y:Year {value: r.publish_year})
+    FOREACH (_ IN CASE WHEN y IS NULL THEN [] ELSE [1] END |
+        MERGE (b)-[:PUBLISHED_IN]->(y))
+    WITH b, r
+    UNWIND coalesce(r.authors, []) AS author_name
+    MATCH (a:Author {name: author_name})
+    MERGE (b)-[:WRITTEN_BY]->(a)
+"""
+
+CYPHER_LOAD_BATCH = "UNWIND $rows AS r" + CYPHER_MERGE_BOOK_ROW
+CYPHER_LINK_BATCH = "UNWIND $rows AS r" + CYPHER_LINK_BOOK_ROW
+
+CYPHER_APOC_LOAD = """
+    CALL apoc.periodic.iterate(
+        'UNWIND $rows AS r RETURN r',
+        $merge_row,
+        {batchSize: $batch_size, parallel: $parallel, retries: 3, params: {rows: $rows}}
+    )
+    YIELD batches, failedBatches, errorMessages
+    RETURN batches, failedBatches, errorMessages
+"""
+
+
+CYPHER_CLEAR_DATABASE = "MATCH (n) DETACH DELETE n"
+
+CYPHER_ANALYTICS_NODE_COUNTS = """
+    MATCH (n)
+    RETURN labels(n)[0] AS label, count(n) AS count
+    ORDER BY count DESC
+"""
+
+CYPHER_ANALYTICS_TOP_AUTHORS = """
+    MATCH (a:Author)<-[:WRITTEN_BY]-(b:Book)
+    RETURN a.name AS author, count(b) AS book_count
+    ORDER BY book_count DESC
+    LIMIT 5
+"""
+
+CYPHER_ANALYTICS_BOOKS_BY_DECADE = """
+    MATCH (b:Book)-[:PUBLISHED_IN]->(y:Year)
+    WITH y.value/10 AS decade, count(b) AS book_count
+    RETURN decade*10 AS decade_start, book_count
+    ORDER BY decade_start
+"""
+
+CYPHER_ANALYTICS_TOP_SUBJECTS = """
+    MATCH (s:Subject)<-[:HAS_SUBJECT]-(b:Book)
+    RETURN s.name AS subject, count(b) AS book_count
+    ORDER BY book_count DESC
+    LIMIT 5
+"""
+
+# Analytics queries keyed by result name, with a function turning each result into plain Python values
+ANALYTICS_QUERIES = {
+    'node_counts': (CYPHER_ANALYTICS_NODE_COUNTS,
+                    lambda result: {record["label"]: record["count"] for record in result}),
+    'top_authors': (CYPHER_ANALYTICS_TOP_AUTHORS,
+                    lambda result: [(record["author"], record["book_count"]) for record in result]),
+    'books_by_decade': (CYPHER_ANALYTICS_BOOKS_BY_DECADE,
+                        lambda result: [(record["decade_start"], record["book_count"]) for record in result]),
+    'top_subjects': (CYPHER_ANALYTICS_TOP_SUBJECTS,
+                     lambda result: [(record["subject"], record["book_count"]) for record in result]),
+}
+
+# Fixed statements (with placeholder parameters) whose plans warm_up() caches before a load
+WARMUP_QUERIES = (
+    (CYPHER_MERGE_AUTHORS, {'authors': []}),
+    (CYPHER_MERGE_SUBJECTS, {'subjects': []}),
+    (CYPHER_MERGE_YEARS, {'years': []}),
+    (CYPHER_LOAD_BATCH, {'rows': []}),
+    (CYPHER_LINK_BATCH, {'rows': []}),
+    (CYPHER_ANALYTICS_NODE_COUNTS, {}),
+    (CYPHER_ANALYTICS_TOP_AUTHORS, {}),
+    (CYPHER_ANALYTICS_BOOKS_BY_DECADE, {}),
+    (CYPHER_ANALYTICS_TOP_SUBJECTS, {}),
+)
+
+
+def install_uvloop():
+    """Switch asyncio to the uvloop event loop when uvloop is installed"""
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+# Drivers shared between connectors with the same settings, as key -> [driver, number of connectors using it]
+_shared_drivers = {}
+_shared_drivers_lock = threading.Lock()
+
+
+def _acquire_driver(uri, user, password, driver_config):
+    """Return (key, driver) for a shared driver, creating it on first use so connects reuse one pool"""
+    key = (uri, user, password, tuple(sorted(driver_config.items())))
+    with _shared_drivers_lock:
+        entry = _shared_drivers.get(key)
+        if entry is None:
+            entry = _shared_drivers[key] = [GraphDatabase.driver(uri, auth=(user, password), **driver_config), 0]
+        entry[1] += 1
+        return key, entry[0]
+
+
+def _release_driver(key):
+    """Drop one connector's use of a shared driver, closing it once no connector uses it"""
+    with _shared_drivers_lock:
+        entry = _shared_drivers[key]
+        entry[1] -= 1
+        if entry[1]:
+            return False
+        del _shared_drivers[key]
+    entry[0].close()
+    return True
+
+
+def _create_entities(tx, entities):
+    """MERGE the distinct authors, subjects and years referenced by a load"""
+    tx.run(CYPHER_MERGE_AUTHORS, authors=entities['authors'])
+    tx.run(CYPHER_MERGE_SUBJECTS, subjects=entities['subjects'])
+    tx.run(CYPHER_MERGE_YEARS, years=entities['years'])
+
+
+async def _create_entities_async(tx, entities):
+    """Async variant of _create_entities"""
+    await tx.run(CYPHER_MERGE_AUTHORS, authors=entities['authors'])
+    await tx.run(CYPHER_MERGE_SUBJECTS, subjects=entities['subjects'])
+    await tx.run(CYPHER_MERGE_YEARS, years=entities['years'])
+
 
-    def __init__(self, uri, user, password):
-        """Initialize Neo4j connection"""
-        self.uri = NEO4J_URI
-        self.user = NEO4J_USER
-        self.password = NEO4J_PASSWORD
+def _create_book_nodes(tx, rows):
+    """MERGE a batch of Book nodes"""
+    tx.run(CYPHER_LOAD_BATCH, rows=rows)
+
+
+async def _create_book_nodes_async(tx, rows):
+    """Async variant of _create_book_nodes"""
+    await tx.run(CYPHER_LOAD_BATCH, rows=rows)
+
+
+def _link_book_nodes(tx, rows):
+    """Link a batch of books to their subject, year and authors"""
+    tx.run(CYPHER_LINK_BATCH, rows=rows)
+
+
+async def _link_book_nodes_async(tx, rows):
+    """Async variant of _link_book_nodes"""
+    await tx.run(CYPHER_LINK_BATCH, rows=rows)
+
+
+def _book_rows(books_df):
+    """Split authors once per frame and build the parameter maps used by the UNWIND query
+
+    clean_data already yields int64 edition counts, float64 scores and Int64 years,
+    so only the nullable columns need <NA>/NaN mapped to None for Bolt.
+    """
+    authors = books_df['authors'].mask(books_df['authors'] == 'Unknown').str.split(', ')
+    publish_year = books_df['publish_year'].astype('Int64').astype(object)
+    prepared = books_df[['id', 'title', 'edition_count', 'confidence_score', 'date_ingested', 'subject']].assign(
+        publish_year=publish_year.where(publish_year.notna(), None),
+        authors=authors.where(authors.notna(), None),
+    )
+    return prepared.to_dict('records')
+
+
+def _unique_entities(books_df):
+    """Collect the sorted distinct authors, subjects and years referenced by the books"""
+    known_authors = books_df['authors'] != 'Unknown'
+    authors = books_df.loc[known_authors, 'authors'].str.split(', ').explode().dropna().unique()
+    years = books_df['publish_year'].dropna().astype('int64').unique()
+    return {
+        'authors': sorted(authors.tolist()),
+        'subjects': sorted(books_df['subject'].unique().tolist()),
+        'years': sorted(years.tolist()),
+    }
+
+
+def _fastest_batch_size(timings):
+    """Pick the probed batch size with the lowest time per book"""
+    if not timings:
+        return BATCH_SIZE_CANDIDATES[0]
+    batch_size = min(timings, key=timings.get)
+    logger.info(f"Using batch size {batch_size} (probed seconds per book: {timings})")
+    return batch_size
+
+
+def _probe_batches(books_df, offset, size, n_batches):
+    """Slice n_batches fresh batches of size books starting at offset, or None if there are too few books left"""
+    probe = books_df.iloc[offset:offset + size * n_batches]
+    if len(probe) < size * n_batches:
+        return None
+    return [probe.iloc[i:i + size] for i in range(0, len(probe), size)]
+
+
+def _shard_books(books_df, n_shards):
+    """Split books into shards by hashing their id, so no two shards write the same Book node"""
+    shard_keys = pd.util.hash_pandas_object(books_df['id'], index=False).to_numpy() % n_shards
+    return [shard for _, shard in books_df.groupby(shard_keys)]
+
+
+class _Neo4jConnectorBase:
+    """Connection settings and session helpers shared by the sync and async connectors"""
+
+    def __init__(self, uri, user, password, max_connection_pool_size=64, connection_acquisition_timeout=60,
+                 max_transaction_retry_time=30, keep_alive=True, connection_timeout=15, database="neo4j"):
+        """Initialize Neo4j connection and connection pool settings"""
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.database = database
+        self.driver_config = {
+            'max_connection_pool_size': max_connection_pool_size,
+            'connection_acquisition_timeout': connection_acquisition_timeout,
+            'max_transaction_retry_time': max_transaction_retry_time,
+            'keep_alive': keep_alive,
+            'connection_timeout': connection_timeout,
+        }
         self.driver = None
 
-    def connect(self):
-        """Establish connection to Neo4j"""
+    def _session(self, **config):
+        """Open a session on the configured database, skipping home database resolution"""
+        return self.driver.session(database=self.database, **config)
+
+    def _write_session(self):
+        """Open a write session for bulk loads that fetches results in one go"""
+        return self._session(fetch_size=-1, default_access_mode=WRITE_ACCESS)
+
+
+class Neo4jConnector(_Neo4jConnectorBase):
+    """Class to handle Neo4j database operations"""
+
+    # Registry key of the shared driver this connector holds, set by connect()
+    _driver_key = None
+
+    def connect(self, warm_up=False):
+        """Establish connection to Neo4j and optionally warm the server's query plan cache"""
         try:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+            if self.driver is None:
+                self._driver_key, self.driver = _acquire_driver(self.uri, self.user, self.password,
+                                                                self.driver_config)
             logger.info("Successfully connected to Neo4j database")
-            return True
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             return False
+        if warm_up:
+            self.warm_up()
+        return True
+
+    def warm_up(self):
+        """EXPLAIN the fixed queries once so later runs hit the server's plan cache"""
+        try:
+            with self._session() as session:
+                for query, parameters in WARMUP_QUERIES:
+                    session.run("EXPLAIN " + query, parameters).consume()
+            logger.info("Query plan cache warmed up")
+        except Exception as e:
+            logger.warning(f"Failed to warm up query plan cache: {e}")
 
     def close(self):
         """Close the Neo4j connection"""
         if self.driver:
-            self.driver.close()
-            logger.info("Neo4j connection closed")
+            if _release_driver(self._driver_key):
+                logger.info("Neo4j connection closed")
+            else:
+                logger.info("Released shared Neo4j driver, still in use by other connectors")
+            self.driver = None
 
     def verify_connection(self):
         """Verify that the connection is working"""
         try:
-            with self.driver.session() as session:
-                result = session.run("RETURN 'Connection successful' AS message")
-                for record in result:
-                    logger.info(record["message"])
-                return True
+            self.driver.verify_connectivity()
+            logger.info("Connection successful")
+            return True
         except Exception as e:
             logger.error(f"Connection verification failed: {e}")
             return False
@@ -50,120 +346,313 @@ class Neo4jConnector:
     def clear_database(self):
         """Clear all nodes and relationships in the database"""
         try:
-            with self.driver.session() as session:
-                session.run("MATCH (n) DETACH DELETE n")
+            with self._session() as session:
+                session.run(CYPHER_CLEAR_DATABASE)
                 logger.info("Database cleared")
         except Exception as e:
             logger.error(f"Failed to clear database: {e}")
 
     def create_constraints(self):
-        """Create constraints to ensure uniqueness"""
+        """Create constraints to ensure uniqueness, all in one write transaction"""
+        def create(tx):
+            for query in CONSTRAINT_QUERIES:
+                tx.run(query)
+
         try:
-            with self.driver.session() as session:
-                session.run("""
-                    CREATE CONSTRAINT book_id_constraint IF NOT EXISTS
-                    FOR (b:Book) REQUIRE b.id IS UNIQUE
-                """)
-                session.run("""
-                    CREATE CONSTRAINT author_name_constraint IF NOT EXISTS
-                    FOR (a:Author) REQUIRE a.name IS UNIQUE
-                """)
-                session.run("""
-                    CREATE CONSTRAINT subject_name_constraint IF NOT EXISTS
-                    FOR (s:Subject) REQUIRE s.name IS UNIQUE
-                """)
-                session.run("""
-                    CREATE CONSTRAINT year_value_constraint IF NOT EXISTS
-                    FOR (y:Year) REQUIRE y.value IS UNIQUE
-                """)
+            with self._session() as session:
+                session.execute_write(create)
                 logger.info("Constraints created successfully")
         except Exception as e:
             logger.error(f"Failed to create constraints: {e}")
 
-    def load_books(self, books_df):
-        """Load books data into Neo4j"""
+    def _load_books_with_apoc(self, rows):
+        """Load rows server-side with apoc.periodic.iterate, returning False if APOC is missing or batches fail
+
+        Book MERGEs run in parallel batches since each row only touches its own Book;
+        links to the shared Subject, Year and Author nodes run serially to avoid deadlocks.
+        """
+        for merge_row, parallel in ((CYPHER_MERGE_BOOK_ROW, True), (CYPHER_LINK_BOOK_ROW, False)):
+            try:
+                with self._write_session() as session:
+                    record = session.run(CYPHER_APOC_LOAD, rows=rows, merge_row=merge_row,
+                                         batch_size=APOC_BATCH_SIZE, parallel=parallel).single()
+            except ClientError as e:
+                if e.code == "Neo.ClientError.Procedure.ProcedureNotFound":
+                    logger.info("APOC is not installed, falling back to client-side batches")
+                    return False
+                raise
+            if record["failedBatches"]:
+                logger.warning(f"{record['failedBatches']} APOC batches failed ({record['errorMessages']}), "
+                               f"falling back to client-side batches")
+                return False
+        logger.info(f"Loaded {len(rows)} books with APOC")
+        return True
+
+    def _link_books(self, rows):
+        """Create all links to shared Subject, Year and Author nodes in one serial pass"""
+        with self._write_session() as session:
+            for i in range(0, len(rows), LINK_BATCH_SIZE):
+                session.execute_write(_link_book_nodes, rows[i:i + LINK_BATCH_SIZE])
+
+    def _write_batch(self, batch):
+        """Write one batch of books on its own session"""
+        with self._write_session() as session:
+            session.execute_write(_create_book_nodes, _book_rows(batch))
+
+    def _probe_batch_size(self, books_df, max_workers):
+        """Time each candidate batch size under the load's concurrency and return (fastest size, books loaded)
+
+        Only the Book MERGE stage is probed: its parallel batches never share a node, so the
+        timings reflect batch size rather than lock waits, and links are created later in
+        the serial pass. One untimed batch warms up connections and plans first. Each
+        candidate then loads a fresh slice of max_workers batches in parallel, one session
+        per batch as in the real load.
+        """
+        offset = min(BATCH_SIZE_CANDIDATES[0], len(books_df))
+        if offset:
+            self._write_batch(books_df.iloc[:offset])
+        timings = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for size in BATCH_SIZE_CANDIDATES:
+                batches = _probe_batches(books_df, offset, size, max_workers)
+                if batches is None:
+                    break
+                started = time.perf_counter()
+                list(executor.map(self._write_batch, batches))
+                timings[size] = (time.perf_counter() - started) / (size * max_workers)
+                offset += size * max_workers
+        return _fastest_batch_size(timings), offset
+
+    def load_books(self, books_df, batch_size=None, max_workers=None, apoc_min_rows=APOC_MIN_ROWS):
+        """Load books data into Neo4j using one session per worker thread
+
+        Distinct authors, subjects and years are created first. Book nodes are then
+        MERGEd by parallel shards that never write the same node, and finally all
+        links to the shared entities are created in one serial pass, so workers never
+        contend for the same locks. Imports of at least apoc_min_rows books are handed
+        to apoc.periodic.iterate when APOC is available. Without a batch_size, the
+        fastest of BATCH_SIZE_CANDIDATES, timed with max_workers concurrent batches,
+        is used for the rest.
+        """
+        max_workers = max_workers or os.cpu_count() or 4
+
+        def load_shard(shard):
+            with self._write_session() as session:
+                rows = _book_rows(shard)
+                for i in range(0, len(rows), batch_size):
+                    session.execute_write(_create_book_nodes, rows[i:i + batch_size])
+            return len(shard)
+
         try:
-            with self.driver.session() as session:
-                def create_book_nodes(tx, batch):
-                    for _, book in batch.iterrows():
-                        tx.run("""
-                            MERGE (b:Book {id: $id})
-                            SET b.title = $title,
-                                b.edition_count = $edition_count,
-                                b.confidence_score = $confidence_score,
-                                b.date_ingested = $date_ingested
-                        """, id=book['id'], title=book['title'],
-                               edition_count=int(book['edition_count']),
-                               confidence_score=float(book['confidence_score']),
-                               date_ingested=book['date_ingested'])
-                        tx.run("""
-                            MERGE (s:Subject {name: $subject})
-                            MERGE (b:Book {id: $book_id})
-                            MERGE (b)-[:HAS_SUBJECT]->(s)
-                        """, subject=book['subject'], book_id=book['id'])
-                        if pd.notnull(book['publish_year']):
-                            year = int(book['publish_year'])
-                            tx.run("""
-                                MERGE (y:Year {value: $year})
-                                MERGE (b:Book {id: $book_id})
-                                MERGE (b)-[:PUBLISHED_IN]->(y)
-                            """, year=year, book_id=book['id'])
-                        if book['authors'] != 'Unknown':
-                            for author in book['authors'].split(', '):
-                                tx.run("""
-                                    MERGE (a:Author {name: $author_name})
-                                    MERGE (b:Book {id: $book_id})
-                                    MERGE (b)-[:WRITTEN_BY]->(a)
-                                """, author_name=author, book_id=book['id'])
-
-                batch_size = 50
-                for i in range(0, len(books_df), batch_size):
-                    batch = books_df.iloc[i:i + batch_size]
-                    session.execute_write(create_book_nodes, batch)
-                    logger.info(f"Loaded batch {i // batch_size + 1}/{(len(books_df) - 1) // batch_size + 1}")
+            rows = _book_rows(books_df)
+            with self._write_session() as session:
+                session.execute_write(_create_entities, _unique_entities(books_df))
+            if len(books_df) >= apoc_min_rows and self._load_books_with_apoc(rows):
                 logger.info(f"Successfully loaded {len(books_df)} books into Neo4j")
+                return
+            loaded = 0
+            if batch_size is None:
+                batch_size, loaded = self._probe_batch_size(books_df, max_workers)
+            batch_size = min(batch_size, MAX_BATCH_SIZE)
+            shards = _shard_books(books_df.iloc[loaded:], max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(load_shard, shard) for shard in shards]
+                for future in as_completed(futures):
+                    loaded += future.result()
+                    logger.info(f"Loaded {loaded}/{len(books_df)} books")
+            self._link_books(rows)
+            logger.info(f"Successfully loaded {len(books_df)} books into Neo4j")
         except Exception as e:
             logger.error(f"Failed to load books into Neo4j: {e}")
 
     def run_analytics_queries(self):
-        """Run analytics queries and return results"""
+        """Run analytics queries concurrently, each on its own session, and return results"""
+        def run_query(query, to_result):
+            with self._session() as session:
+                return to_result(session.run(query))
+
         analytics_results = {}
         try:
-            with self.driver.session() as session:
-                result = session.run("""
-                    MATCH (n)
-                    RETURN labels(n)[0] AS label, count(n) AS count
-                    ORDER BY count DESC
-                """)
-                analytics_results['node_counts'] = {record["label"]: record["count"] for record in result}
-                result = session.run("""
-                    MATCH (a:Author)<-[:WRITTEN_BY]-(b:Book)
-                    RETURN a.name AS author, count(b) AS book_count
-                    ORDER BY book_count DESC
-                    LIMIT 5
-                """)
-                analytics_results['top_authors'] = [(record["author"], record["book_count"]) for record in result]
-                result = session.run("""
-                    MATCH (b:Book)-[:PUBLISHED_IN]->(y:Year)
-                    WITH y.value/10 AS decade, count(b) AS book_count
-                    RETURN decade*10 AS decade_start, book_count
-                    ORDER BY decade_start
-                """)
-                analytics_results['books_by_decade'] = [(record["decade_start"], record["book_count"]) for record in
-                                                        result]
-                result = session.run("""
-                    MATCH (s:Subject)<-[:HAS_SUBJECT]-(b:Book)
-                    RETURN s.name AS subject, count(b) AS book_count
-                    ORDER BY book_count DESC
-                    LIMIT 5
-                """)
-                analytics_results['top_subjects'] = [(record["subject"], record["book_count"]) for record in result]
-                logger.info("Analytics queries completed successfully")
-                return analytics_results
+            with ThreadPoolExecutor(max_workers=len(ANALYTICS_QUERIES)) as executor:
+                futures = {name: executor.submit(run_query, query, to_result)
+                           for name, (query, to_result) in ANALYTICS_QUERIES.items()}
+                for name, future in futures.items():
+                    analytics_results[name] = future.result()
+            logger.info("Analytics queries completed successfully")
+            return analytics_results
         except Exception as e:
             logger.error(f"Failed to run analytics queries: {e}")
             return {}
 
 
+class AsyncNeo4jConnector(_Neo4jConnectorBase):
+    """Class to handle Neo4j database operations from asyncio code"""
+
+    async def connect(self, warm_up=False):
+        """Establish connection to Neo4j and optionally warm the server's query plan cache"""
+        try:
+            if self.driver is None:
+                self.driver = AsyncGraphDatabase.driver(self.uri, auth=(self.user, self.password),
+                                                         **self.driver_config)
+            logger.info("Successfully connected to Neo4j database")
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j: {e}")
+            return False
+        if warm_up:
+            await self.warm_up()
+        return True
+
+    async def warm_up(self):
+        """EXPLAIN the fixed queries once so later runs hit the server's plan cache"""
+        try:
+            async with self._session() as session:
+                for query, parameters in WARMUP_QUERIES:
+                    result = await session.run("EXPLAIN " + query, parameters)
+                    await result.consume()
+            logger.info("Query plan cache warmed up")
+        except Exception as e:
+            logger.warning(f"Failed to warm up query plan cache: {e}")
+
+    async def close(self):
+        """Close the Neo4j connection"""
+        if self.driver:
+            await self.driver.close()
+            logger.info("Neo4j connection closed")
+            self.driver = None
+
+    async def verify_connection(self):
+        """Verify that the connection is working"""
+        try:
+            await self.driver.verify_connectivity()
+            logger.info("Connection successful")
+            return True
+        except Exception as e:
+            logger.error(f"Connection verification failed: {e}")
+            return False
+
+    async def clear_database(self):
+        """Clear all nodes and relationships in the database"""
+        try:
+            async with self._session() as session:
+                result = await session.run(CYPHER_CLEAR_DATABASE)
+                await result.consume()
+                logger.info("Database cleared")
+        except Exception as e:
+            logger.error(f"Failed to clear database: {e}")
+
+    async def create_constraints(self):
+        """Create constraints to ensure uniqueness, all in one write transaction"""
+        async def create(tx):
+            for query in CONSTRAINT_QUERIES:
+                await tx.run(query)
+
+        try:
+            async with self._session() as session:
+                await session.execute_write(create)
+                logger.info("Constraints created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create constraints: {e}")
+
+    async def _write_batch(self, batch):
+        """Write one batch of books on its own session"""
+        async with self._write_session() as session:
+            await session.execute_write(_create_book_nodes_async, _book_rows(batch))
+
+    async def _probe_batch_size(self, books_df, max_concurrency):
+        """Time each candidate batch size under the load's concurrency and return (fastest size, books loaded)
+
+        Probes the lock-free Book MERGE stage, as Neo4jConnector._probe_batch_size does.
+        """
+        offset = min(BATCH_SIZE_CANDIDATES[0], len(books_df))
+        if offset:
+            await self._write_batch(books_df.iloc[:offset])
+        timings = {}
+        for size in BATCH_SIZE_CANDIDATES:
+            batches = _probe_batches(books_df, offset, size, max_concurrency)
+            if batches is None:
+                break
+            started = time.perf_counter()
+            await asyncio.gather(*(self._write_batch(batch) for batch in batches))
+            timings[size] = (time.perf_counter() - started) / (size * max_concurrency)
+            offset += size * max_concurrency
+        return _fastest_batch_size(timings), offset
 
+    async def _load_books_with_apoc(self, rows):
+        """Load rows server-side with apoc.periodic.iterate, returning False if APOC is missing or batches fail
 
+        Same two passes as Neo4jConnector._load_books_with_apoc: parallel Book MERGEs, then serial links.
+        """
+        for merge_row, parallel in ((CYPHER_MERGE_BOOK_ROW, True), (CYPHER_LINK_BOOK_ROW, False)):
+            try:
+                async with self._write_session() as session:
+                    result = await session.run(CYPHER_APOC_LOAD, rows=rows, merge_row=merge_row,
+                                               batch_size=APOC_BATCH_SIZE, parallel=parallel)
+                    record = await result.single()
+            except ClientError as e:
+                if e.code == "Neo.ClientError.Procedure.ProcedureNotFound":
+                    logger.info("APOC is not installed, falling back to client-side batches")
+                    return False
+                raise
+            if record["failedBatches"]:
+                logger.warning(f"{record['failedBatches']} APOC batches failed ({record['errorMessages']}), "
+                               f"falling back to client-side batches")
+                return False
+        logger.info(f"Loaded {len(rows)} books with APOC")
+        return True
+
+    async def _link_books(self, rows):
+        """Create all links to shared Subject, Year and Author nodes in one serial pass"""
+        async with self._write_session() as session:
+            for i in range(0, len(rows), LINK_BATCH_SIZE):
+                await session.execute_write(_link_book_nodes_async, rows[i:i + LINK_BATCH_SIZE])
+
+    async def load_books(self, books_df, batch_size=None, max_concurrency=None, apoc_min_rows=APOC_MIN_ROWS):
+        """Load books data into Neo4j, writing each shard on its own concurrent session
+
+        Same stages as Neo4jConnector.load_books: entities, APOC for large imports, otherwise
+        parallel Book shards followed by a serial link pass.
+        """
+        max_concurrency = max_concurrency or os.cpu_count() or 4
+
+        async def load_shard(shard):
+            async with self._write_session() as session:
+                rows = _book_rows(shard)
+                for i in range(0, len(rows), batch_size):
+                    await session.execute_write(_create_book_nodes_async, rows[i:i + batch_size])
+            return len(shard)
+
+        try:
+            rows = _book_rows(books_df)
+            async with self._write_session() as session:
+                await session.execute_write(_create_entities_async, _unique_entities(books_df))
+            if len(books_df) >= apoc_min_rows and await self._load_books_with_apoc(rows):
+                logger.info(f"Successfully loaded {len(books_df)} books into Neo4j")
+                return
+            loaded = 0
+            if batch_size is None:
+                batch_size, loaded = await self._probe_batch_size(books_df, max_concurrency)
+            batch_size = min(batch_size, MAX_BATCH_SIZE)
+            shards = _shard_books(books_df.iloc[loaded:], max_concurrency)
+            for shard_done in asyncio.as_completed([load_shard(shard) for shard in shards]):
+                loaded += await shard_done
+                logger.info(f"Loaded {loaded}/{len(books_df)} books")
+            await self._link_books(rows)
+            logger.info(f"Successfully loaded {len(books_df)} books into Neo4j")
+        except Exception as e:
+            logger.error(f"Failed to load books into Neo4j: {e}")
+
+    async def run_analytics_queries(self):
+        """Run analytics queries concurrently, each on its own session, and return results"""
+        async def run_query(query, to_result):
+            async with self._session() as session:
+                result = await session.run(query)
+                return to_result([record async for record in result])
+
+        try:
+            results = await asyncio.gather(*(run_query(query, to_result)
+                                             for query, to_result in ANALYTICS_QUERIES.values()))
+            logger.info("Analytics queries completed successfully")
+            return dict(zip(ANALYTICS_QUERIES, results))
+        except Exception as e:
+            logger.error(f"Failed to run analytics queries: {e}")
+            return {}
@@ -1,16 +1,37 @@
 import requests  # For making HTTP requests to APIs
+from requests.adapters import HTTPAdapter  # For connection pooling and retries
+from urllib3.util.retry import Retry  # For retrying failed API requests
+from concurrent.futures import ThreadPoolExecutor  # For fetching several subjects concurrently
+import numpy as np  # For vectorized conditional column values
 import pandas as pd  # For handling and manipulating tabular data
 from datetime import datetime  # For working with date and time
 import re  # For regular expression operations
 from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
 
-
-def fetch_books_by_subject(subject, limit=20):
-    """Fetch books from Open Library API by subject."""
-    print(f"Fetching books related to '{subject}'...")
-
-    url = f"http://openlibrary.org/subjects/{subject}.json?limit={limit}"
-    response = requests.get(url)
+# Precompiled patterns used when cleaning titles and author names
+_ID_RE = re.compile(r'[^a-z0-9]')
+_WS_RE = re.compile(r'\s+')
+
+
+# Shared HTTP session so repeated API calls reuse keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+def _fetch_subject(subject, limit):
+    """Fetch a single subject page using the shared session."""
+    url = f"https://openlibrary.org/subjects/{subject}.json?limit={limit}"
+    try:
+        response = _SESSION.get(url, timeout=10)
+    except requests.RequestException as e:
+        print(f"Error: request for '{subject}' failed: {e}")
+        return None
 
     if response.status_code == 200:
         return response.json()
@@ -19,34 +40,62 @@ def fetch_books_by_subject(subject, limit=20):
         return None
 
 
+def fetch_books_by_subjects(subjects, limit=20, max_workers=8):
+    """Fetch books for several subjects concurrently, returning one response (or None) per subject."""
+    print(f"Fetching books related to {', '.join(repr(s) for s in subjects)}...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda subject: _fetch_subject(subject, limit), subjects))
+
+
+def fetch_books_by_subject(subject, limit=20):
+    """Fetch books from Open Library API by subject."""
+    print(f"Fetching books related to '{subject}'...")
+    return _fetch_subject(subject, limit)
+
+
+BOOK_COLUMNS = ['title', 'authors', 'publish_year', 'subject', 'edition_count', 'key']
+
+
+def _to_year(values):
+    """Convert values to nullable Int64 years; missing, non-numeric or fractional values become <NA>."""
+    years = pd.to_numeric(pd.Series(values, dtype='object'), errors='coerce')
+    return years.where(years.mod(1) == 0).astype('Int64')
+
+
+def _books_frame(titles, authors, years, subjects, editions, keys):
+    """Build the typed books DataFrame from per-column lists, tolerating malformed API values."""
+    return pd.DataFrame({
+        'title': pd.Series(titles, dtype='object'),
+        'authors': pd.Series(authors, dtype='object'),
+        'publish_year': _to_year(years),
+        'subject': pd.Series(subjects, dtype='object'),
+        'edition_count': pd.to_numeric(pd.Series(editions, dtype='object'), errors='coerce').fillna(0).astype('int64'),
+        'key': pd.Series(keys, dtype='object'),
+    }, columns=BOOK_COLUMNS)
+
+
 def extract_book_data(api_response):
-    """Extract relevant book information from API response."""
+    """Extract relevant book information from API response into a DataFrame."""
     if not api_response or 'works' not in api_response:
-        return []
+        return _books_frame([], [], [], [], [], [])
 
-    books = []
-    for work in api_response['works']:
-        # Extract authors (handling potential missing data)
-        authors = []
-        if 'authors' in work:
-            authors = [author.get('name', 'Unknown') for author in work['authors']]
+    works = api_response['works']
+    subject = api_response.get('name', 'Unknown Subject')
+    _join = ', '.join
 
+    titles, authors, years, editions, keys = [], [], [], [], []
+    for work in works:
+        titles.append(work.get('title', 'Unknown Title'))
+        # Extract authors (handling potential missing data)
+        names = [author.get('name', 'Unknown') for author in work.get('authors', ())]
+        authors.append(_join(names) if names else 'Unknown')
         # Extract year (handling potential missing data)
-        year = None
-        if 'first_publish_year' in work:
-            year = work['first_publish_year']
-
-        book = {
-            'title': work.get('title', 'Unknown Title'),
-            'authors': ', '.join(authors) if authors else 'Unknown',
-            'publish_year': year,
-            'subject': api_response.get('name', 'Unknown Subject'),
-            'edition_count': work.get('edition_count', 0),
-            'key': work.get('key', '')
-        }
-        books.append(book)
+        years.append(work.get('first_publish_year'))
+        editions.append(work.get('edition_count', 0))
+        keys.append(work.get('key', ''))
 
-    return books
+    return _books_frame(titles, authors, years, [subject] * len(works), editions, keys)
 
 
 def clean_data(df):
@@ -57,26 +106,24 @@ def clean_data(df):
     # Clean titles (remove extra whitespace, normalize capitalization)
     cleaned_df['title'] = cleaned_df['title'].str.strip().str.title()
 
-    # Replace missing years with NaN
-    cleaned_df['publish_year'] = pd.to_numeric(cleaned_df['publish_year'], errors='coerce')
+    # Keep years as nullable integers, with missing or invalid years as <NA>
+    cleaned_df['publish_year'] = _to_year(cleaned_df['publish_year'])
 
     # Clean author names
-    cleaned_df['authors'] = cleaned_df['authors'].str.replace(r'\s+', ' ', regex=True).str.strip()
+    cleaned_df['authors'] = cleaned_df['authors'].str.replace(_WS_RE, ' ', regex=True).str.strip()
 
     # Create a unique identifier for each book
-    cleaned_df['id'] = cleaned_df.apply(
-        lambda x: f"book_{re.sub(r'[^a-zA-Z0-9]', '', x['title'].lower())[:20]}_{x['publish_year']}",
-        axis=1
-    )
+    slug = cleaned_df['title'].str.lower().str.replace(_ID_RE, '', regex=True).str.slice(0, 20)
+    year = cleaned_df['publish_year'].astype('string').fillna('nan').astype(slug.dtype)
+    cleaned_df['id'] = 'book_' + slug + '_' + year
 
     # Add metadata for knowledge graph integration
     cleaned_df['entity_type'] = 'book'
     cleaned_df['date_ingested'] = datetime.now().strftime('%Y-%m-%d')
 
     # Add a confidence score column (could be based on data completeness)
-    cleaned_df['confidence_score'] = cleaned_df.apply(
-        lambda x: 1.0 if pd.notnull(x['publish_year']) and x['authors'] != 'Unknown' else 0.7,
-        axis=1
+    cleaned_df['confidence_score'] = np.where(
+        cleaned_df['publish_year'].notna() & (cleaned_df['authors'] != 'Unknown'), 1.0, 0.7
     )
 
     return cleaned_df
@@ -86,19 +133,26 @@ def generate_knowledge_graph_triples(df):
     """Generate example knowledge graph triples from the cleaned data."""
     triples = []
 
-    for _, book in df.iterrows():
+    # Split authors and format years once per column; missing values become None
+    authors = df['authors'].mask(df['authors'] == 'Unknown').str.split(', ')
+    years = df['publish_year'].astype('Int64').astype('string').astype(object)
+    rows = df[['id', 'title', 'subject']].assign(
+        authors=authors.where(authors.notna(), None),
+        publish_year=years.where(years.notna(), None),
+    )
+
+    for book_id, title, subject, book_authors, year in rows.itertuples(index=False, name=None):
         # Subject-Predicate-Object triples
-        triples.append(f"{book['id']} - HAS_TITLE - {book['title']}")
+        triples.append(f"{book_id} - HAS_TITLE - {title}")
 
-        if book['authors'] != 'Unknown':
-            authors = book['authors'].split(', ')
-            for author in authors:
-                triples.append(f"{book['id']} - WRITTEN_BY - {author}")
+        if book_authors is not None:
+            for author in book_authors:
+                triples.append(f"{book_id} - WRITTEN_BY - {author}")
 
-        if pd.notnull(book['publish_year']):
-            triples.append(f"{book['id']} - PUBLISHED_IN - {int(book['publish_year'])}")
+        if year is not None:
+            triples.append(f"{book_id} - PUBLISHED_IN - {year}")
 
-        triples.append(f"{book['id']} - HAS_SUBJECT - {book['subject']}")
+        triples.append(f"{book_id} - HAS_SUBJECT - {subject}")
 
     return triples
 
@@ -113,14 +167,13 @@ def main():
         print("Failed to fetch data. Exiting.")
         return
 
-    # 2. Transform API data into structured format
-    books = extract_book_data(api_data)
-    if not books:
+    # 2. Transform API data into a structured DataFrame
+    df = extract_book_data(api_data)
+    if df.empty:
         print("No book data found. Exiting.")
         return
 
-    # 3. Create DataFrame
-    df = pd.DataFrame(books)
+    # 3. Inspect the DataFrame
     print(f"\nRaw data sample (first 3 records):")
     print(df.head(3))
 
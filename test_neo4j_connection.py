@@ -1,18 +1,15 @@
-from neo4j import GraphDatabase
 from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from neo4j_connection import Neo4jConnector
 
 def test_connection():
     """Test the connection to the Neo4j database."""
-    try:
-        driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
-        with driver.session() as session:
-            result = session.run("RETURN 'Connection successful' AS message")
-            for record in result:
-                print(record["message"])
-        driver.close()
+    connector = Neo4jConnector(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
+    if connector.connect(warm_up=False) and connector.verify_connection():
+        print("Connection successful")
         print("Connection test completed!")
-    except Exception as e:
-        print(f"Connection failed: {e}")
+    else:
+        print("Connection failed")
+    connector.close()
 
 if __name__ == "__main__":
     test_connection()
\ No newline at end of file
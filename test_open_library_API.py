@@ -0,0 +1,30 @@
+from open_library_API import extract_book_data, clean_data
+
+def test_malformed_works():
+    """Test that malformed works are cleaned instead of crashing the pipeline."""
+    api_response = {
+        'name': 'sea',
+        'works': [
+            {'title': 'A', 'first_publish_year': 'unknown', 'edition_count': None},
+            {'title': 'B', 'first_publish_year': 1870.5, 'edition_count': '3'},
+            {'title': 'C', 'authors': [{'name': 'Jules  Verne'}], 'first_publish_year': 1870, 'edition_count': 382},
+            {},
+        ],
+    }
+    cleaned_df = clean_data(extract_book_data(api_response))
+
+    assert list(cleaned_df['id']) == ['book_a_nan', 'book_b_nan', 'book_c_1870', 'book_unknowntitle_nan']
+    assert list(cleaned_df['edition_count']) == [0, 3, 382, 0]
+    assert list(cleaned_df['authors']) == ['Unknown', 'Unknown', 'Jules Verne', 'Unknown']
+    assert list(cleaned_df['confidence_score']) == [0.7, 0.7, 1.0, 0.7]
+
+def test_missing_works():
+    """Test that an empty API response yields an empty cleaned frame."""
+    cleaned_df = clean_data(extract_book_data(None))
+    assert cleaned_df.empty
+    assert 'id' in cleaned_df.columns
+
+if __name__ == "__main__":
+    test_malformed_works()
+    test_missing_works()
+    print("Open Library data tests completed!")
\ No newline at end of file